@@ -7,7 +7,14 @@ from typing import Any, Callable
 
 
 def _get_attribute_name(node: ast.Attribute) -> str:
-    return f"{get_name(node.value)}.{node.attr}"
+    # Walk the dotted chain iteratively rather than recursively formatting each intermediate name.
+    names = [node.attr]
+    value = node.value
+    while type(value) is ast.Attribute:
+        names.append(value.attr)
+        value = value.value
+    names.append(get_name(value))
+    return ".".join(reversed(names))
 
 
 def _get_name_name(node: ast.Name) -> str:
@@ -29,6 +36,8 @@ def get_name(node: ast.AST) -> str:
     Returns:
         A list of names.
     """
+    if type(node) is ast.Name:
+        return node.id
     return _node_name_map[type(node)](node)
 
 
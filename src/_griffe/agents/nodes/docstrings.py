@@ -19,13 +19,19 @@ def get_docstring(
     Returns:
         A tuple with the value and line numbers of the docstring.
     """
-    # TODO: possible optimization using a type map
-    if isinstance(node, ast.Expr):
+    # We compare exact types rather than using `isinstance`, since AST node classes are never subclassed.
+    if type(node) is ast.Expr:
         doc = node.value
-    elif not strict and node.body and isinstance(node.body, list) and isinstance(node.body[0], ast.Expr):  # type: ignore[attr-defined]
-        doc = node.body[0].value  # type: ignore[attr-defined]
-    else:
+    elif strict:
         return None, None, None
-    if isinstance(doc, ast.Constant) and isinstance(doc.value, str):
+    else:
+        body = getattr(node, "body", None)
+        if not body or type(body) is not list:
+            return None, None, None
+        first = body[0]
+        if type(first) is not ast.Expr:
+            return None, None, None
+        doc = first.value
+    if type(doc) is ast.Constant and type(doc.value) is str:
         return doc.value, doc.lineno, doc.end_lineno
     return None, None, None
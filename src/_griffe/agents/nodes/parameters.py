@@ -3,14 +3,10 @@
 from __future__ import annotations
 
 import ast
-from itertools import zip_longest
-from typing import TYPE_CHECKING, Optional, Union
+from typing import Optional, Union
 
 from _griffe.enumerations import ParameterKind
 
-if TYPE_CHECKING:
-    from collections.abc import Iterable
-
 ParametersType = list[tuple[str, Optional[ast.AST], ParameterKind, Optional[Union[str, ast.AST]]]]
 """Type alias for the list of parameters of a function."""
 
@@ -18,30 +14,14 @@ ParametersType = list[tuple[str, Optional[ast.AST], ParameterKind, Optional[Unio
 def get_parameters(node: ast.arguments) -> ParametersType:
     parameters: ParametersType = []
 
-    # TODO: probably some optimizations to do here
-    args_kinds_defaults: Iterable = reversed(
-        (
-            *zip_longest(
-                reversed(
-                    (
-                        *zip_longest(
-                            node.posonlyargs,
-                            [],
-                            fillvalue=ParameterKind.positional_only,
-                        ),
-                        *zip_longest(node.args, [], fillvalue=ParameterKind.positional_or_keyword),
-                    ),
-                ),
-                reversed(node.defaults),
-                fillvalue=None,
-            ),
-        ),
-    )
-    arg: ast.arg
-    kind: ParameterKind
-    arg_default: ast.AST | None
-    for (arg, kind), arg_default in args_kinds_defaults:
-        parameters.append((arg.arg, arg.annotation, kind, arg_default))
+    # Positional defaults apply to the last positional parameters.
+    positional_args = [*node.posonlyargs, *node.args]
+    posonly_count = len(node.posonlyargs)
+    defaults_start = len(positional_args) - len(node.defaults)
+    for index, arg in enumerate(positional_args):
+        kind = ParameterKind.positional_only if index < posonly_count else ParameterKind.positional_or_keyword
+        default = node.defaults[index - defaults_start] if index >= defaults_start else None
+        parameters.append((arg.arg, arg.annotation, kind, default))
 
     if node.vararg:
         parameters.append(
@@ -53,19 +33,8 @@ def get_parameters(node: ast.arguments) -> ParametersType:
             ),
         )
 
-    # TODO: probably some optimizations to do here
-    kwargs_defaults: Iterable = reversed(
-        (
-            *zip_longest(
-                reversed(node.kwonlyargs),
-                reversed(node.kw_defaults),
-                fillvalue=None,
-            ),
-        ),
-    )
-    kwarg: ast.arg
-    kwarg_default: ast.AST | None
-    for kwarg, kwarg_default in kwargs_defaults:
+    # Keyword-only defaults are always as many as keyword-only parameters (`None` when there is no default).
+    for kwarg, kwarg_default in zip(node.kwonlyargs, node.kw_defaults):
         parameters.append(
             (kwarg.arg, kwarg.annotation, ParameterKind.keyword_only, kwarg_default),
         )
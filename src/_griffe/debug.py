@@ -10,7 +10,6 @@ import os
 import platform
 import sys
 from dataclasses import dataclass
-from importlib import metadata
 
 
 @dataclass
@@ -71,6 +70,9 @@ def _get_version(dist: str = "griffe") -> str:
     Returns:
         A version number.
     """
+    # Importing `importlib.metadata` is costly, and only needed when printing debug information.
+    from importlib import metadata  # noqa: PLC0415
+
     try:
         return metadata.version(dist)
     except metadata.PackageNotFoundError:
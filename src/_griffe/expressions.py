@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import ast
 import sys
+from contextlib import suppress
 from dataclasses import dataclass
 from dataclasses import fields as getfields
 from functools import partial
@@ -46,9 +47,16 @@ def _join(
 ) -> Iterator[str | Expr]:
     it = iter(elements)
     try:
-        yield from _yield(next(it), flat=flat)
+        first = next(it)
     except StopIteration:
         return
+    yield from _yield(first, flat=flat)
+    # Joints are almost always strings: yield them directly instead of going through `_yield`.
+    if isinstance(joint, str):
+        for element in it:
+            yield joint
+            yield from _yield(element, flat=flat)
+        return
     for element in it:
         yield from _yield(joint, flat=flat)
         yield from _yield(element, flat=flat)
@@ -86,7 +94,7 @@ class Expr:
     """Base class for expressions."""
 
     def __str__(self) -> str:
-        return "".join(elem if isinstance(elem, str) else elem.name for elem in self.iterate(flat=True))  # type: ignore[attr-defined]
+        return "".join([elem if isinstance(elem, str) else elem.name for elem in self.iterate(flat=True)])  # type: ignore[attr-defined]
 
     def __iter__(self) -> Iterator[str | Expr]:
         """Iterate on the expression syntax and elements."""
@@ -614,23 +622,29 @@ class ExprName(Expr):
         If a callable was given, call it and return its result.
         It the name cannot be resolved, return the source.
         """
-        if isinstance(self.parent, ExprName):
-            return f"{self.parent.path}.{self.name}"
-        return self.name
+        return ".".join(reversed(self._chain()[0]))
 
     @property
     def canonical_path(self) -> str:
         """The canonical name (resolved one, not alias name)."""
-        if self.parent is None:
-            return self.name
-        if isinstance(self.parent, ExprName):
-            return f"{self.parent.canonical_path}.{self.name}"
-        if isinstance(self.parent, str):
-            return f"{self.parent}.{self.name}"
-        try:
-            return self.parent.resolve(self.name)
-        except NameResolutionError:
-            return self.name
+        names, root_parent = self._chain()
+        root = names.pop()
+        if isinstance(root_parent, str):
+            root = f"{root_parent}.{root}"
+        elif root_parent is not None:
+            with suppress(NameResolutionError):
+                root = root_parent.resolve(root)
+        return ".".join((root, *reversed(names)))
+
+    def _chain(self) -> tuple[list[str], str | Module | Class | None]:
+        # Walk up the parent names iteratively (instead of recursively building each intermediate path),
+        # and return the names from right to left, as well as the parent of the leftmost name.
+        names = [self.name]
+        parent = self.parent
+        while isinstance(parent, ExprName):
+            names.append(parent.name)
+            parent = parent.parent
+        return names, parent
 
     @property
     def resolved(self) -> Module | Class | None:
@@ -920,9 +934,9 @@ def _build_boolop(node: ast.BoolOp, parent: Module | Class, **kwargs: Any) -> Ex
 
 def _build_call(node: ast.Call, parent: Module | Class, **kwargs: Any) -> Expr:
     function = _build(node.func, parent, **kwargs)
-    positional_args = [_build(arg, parent, **kwargs) for arg in node.args]
-    keyword_args = [_build(kwarg, parent, function=function, **kwargs) for kwarg in node.keywords]
-    return ExprCall(function, [*positional_args, *keyword_args])
+    arguments = [_build(arg, parent, **kwargs) for arg in node.args]
+    arguments += [_build(kwarg, parent, function=function, **kwargs) for kwarg in node.keywords]
+    return ExprCall(function, arguments)
 
 
 def _build_compare(node: ast.Compare, parent: Module | Class, **kwargs: Any) -> Expr:
@@ -942,6 +956,9 @@ def _build_comprehension(node: ast.comprehension, parent: Module | Class, **kwar
     )
 
 
+_small_int_reprs = {number: repr(number) for number in range(-5, 257)}
+
+
 def _build_constant(
     node: ast.Constant,
     parent: Module | Class,
@@ -978,7 +995,16 @@ def _build_constant(
                 )
             else:
                 return _build(parsed.body, parent, **kwargs)  # type: ignore[attr-defined]
-    return {type(...): lambda _: "..."}.get(type(node.value), repr)(node.value)
+        return repr(node.value)
+    # Apart from strings, constants are mostly `None` and small integers:
+    # use pre-computed representations instead of building new strings with `repr`.
+    if node.value is None:
+        return "None"
+    if node.value is ...:
+        return "..."
+    if type(node.value) is int:
+        return _small_int_reprs.get(node.value) or repr(node.value)
+    return repr(node.value)
 
 
 def _build_dict(node: ast.Dict, parent: Module | Class, **kwargs: Any) -> Expr:
@@ -1174,7 +1200,18 @@ _node_map: dict[type, Callable[[Any, Module | Class], Expr]] = {
 
 
 def _build(node: ast.AST, parent: Module | Class, **kwargs: Any) -> Expr:
-    return _node_map[type(node)](node, parent, **kwargs)
+    # Dispatching on a map keyed by node types is faster than the `visit_*` method lookup
+    # of `ast.NodeVisitor`, and lets us pass the parent and options down to builders.
+    # Names, constants and attributes are by far the most frequent nodes,
+    # so we check for them first to spare the map lookup.
+    node_type = type(node)
+    if node_type is ast.Name:
+        return ExprName(node.id, parent)  # type: ignore[attr-defined]
+    if node_type is ast.Constant:
+        return _build_constant(node, parent, **kwargs)  # type: ignore[arg-type,return-value]
+    if node_type is ast.Attribute:
+        return _build_attribute(node, parent, **kwargs)  # type: ignore[arg-type]
+    return _node_map[node_type](node, parent, **kwargs)
 
 
 def get_expression(
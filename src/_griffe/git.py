@@ -4,22 +4,43 @@
 
 from __future__ import annotations
 
+import hashlib
 import os
 import re
 import shutil
 import subprocess
+import sys
 import unicodedata
-from contextlib import contextmanager
+from contextlib import contextmanager, suppress
+from functools import lru_cache
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from _griffe.exceptions import GitError
 
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
 if TYPE_CHECKING:
-    from collections.abc import Iterator
+    from collections.abc import Iterator, Sequence
 
 _WORKTREE_PREFIX = "griffe-worktree-"
+_WORKTREE_CACHE_SIZE = 8
+_LOADABLE_SUFFIXES = (".py", ".pyi", ".so", ".pyd", ".pth")
+
+# Options and environment variables used for every Git command we run.
+# We only run internal, non-interactive commands: hooks, automatic maintenance,
+# optional locks and credential prompts are disabled. User and system configuration
+# are kept, since they can hold settings such as `safe.directory` that we rely on.
+_GIT_OPTIONS = ("-c", "core.hooksPath=/dev/null", "-c", "gc.auto=0")
+_GIT_ENV = {"GIT_OPTIONAL_LOCKS": "0", "GIT_TERMINAL_PROMPT": "0"}
+
+
+def _run_git(*args: str | Path, **kwargs: Any) -> subprocess.CompletedProcess:
+    return subprocess.run(["git", *_GIT_OPTIONS, *args], env={**os.environ, **_GIT_ENV}, **kwargs)  # noqa: PLW1510
 
 
 def _normalize(value: str) -> str:
@@ -28,6 +49,51 @@ def _normalize(value: str) -> str:
     return re.sub(r"[-\s]+", "-", value).strip("-")
 
 
+def _find_git_dir(path: Path) -> Path | None:
+    # Look for a `.git` directory, or a `.git` file pointing to the Git directory
+    # (linked worktrees, submodules), in the given directory or its parents.
+    for directory in (path, *path.parents):
+        git_path = directory / ".git"
+        if git_path.is_dir():
+            return git_path if (git_path / "HEAD").is_file() else None
+        if git_path.is_file():
+            content = git_path.read_text(encoding="utf8").strip()
+            if not content.startswith("gitdir:"):
+                return None
+            git_dir = directory / content[len("gitdir:") :].strip()
+            return git_dir if git_dir.is_dir() else None
+    return None
+
+
+def _find_common_git_dir(path: Path) -> Path | None:
+    # Linked worktrees have their own Git directory, pointing to the main one (shared refs, objects, modules).
+    git_dir = _find_git_dir(path)
+    if git_dir is None:
+        return None
+    commondir = git_dir / "commondir"
+    if commondir.is_file():
+        return git_dir / commondir.read_text(encoding="utf8").strip()
+    return git_dir
+
+
+def _tags_mtime(path: Path) -> tuple[int, int]:
+    # Latest modification time of the tags directories (nested ones included, for tags like `release/1.0`)
+    # and modification time of the packed refs file, used to invalidate the cache of latest tags
+    # when tags are created or deleted.
+    git_dir = _find_common_git_dir(path)
+    if git_dir is None:
+        return 0, 0
+    tags_mtime = 0
+    for tags_dir, _, _ in os.walk(git_dir / "refs" / "tags"):
+        with suppress(OSError):
+            tags_mtime = max(tags_mtime, os.stat(tags_dir).st_mtime_ns)  # noqa: PTH116
+    try:
+        packed_refs_mtime = (git_dir / "packed-refs").stat().st_mtime_ns
+    except OSError:
+        packed_refs_mtime = 0
+    return tags_mtime, packed_refs_mtime
+
+
 def assert_git_repo(path: str | Path) -> None:
     """Assert that a directory is a Git repository.
 
@@ -37,35 +103,24 @@ def assert_git_repo(path: str | Path) -> None:
     Raises:
         OSError: When the directory is not a Git repository.
     """
-    if not shutil.which("git"):
-        raise RuntimeError("Could not find git executable. Please install git.")
-
-    try:
-        subprocess.run(
-            ["git", "-C", str(path), "rev-parse", "--is-inside-work-tree"],
-            check=True,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-        )
-    except subprocess.CalledProcessError as err:
-        raise OSError(f"Not a git repository: {path}") from err
+    directory = Path(path).resolve()
+    if not directory.is_dir() or _find_git_dir(directory) is None:
+        raise OSError(f"Not a git repository: {path}")
 
 
-def get_latest_tag(repo: str | Path) -> str:
-    """Get latest tag of a Git repository.
-
-    Parameters:
-        repo: The path to Git repository.
-
-    Returns:
-        The latest tag.
-    """
-    if isinstance(repo, str):
-        repo = Path(repo)
+def _resolve_repo(repo: str | Path) -> Path:
+    repo = Path(repo).resolve()
     if not repo.is_dir():
         repo = repo.parent
-    process = subprocess.run(
-        ["git", "tag", "-l", "--sort=-creatordate"],
+    return repo
+
+
+@lru_cache(maxsize=32)
+def _get_latest_tag(repo: Path, tags_mtime: tuple[int, int]) -> str:  # noqa: ARG001
+    process = _run_git(
+        "tag",
+        "-l",
+        "--sort=-creatordate",
         cwd=repo,
         text=True,
         stdout=subprocess.PIPE,
@@ -78,33 +133,345 @@ def get_latest_tag(repo: str | Path) -> str:
     return output.split("\n", 1)[0]
 
 
+def get_latest_tag(repo: str | Path) -> str:
+    """Get latest tag of a Git repository.
+
+    Results are cached until tags are created or deleted in the repository.
+
+    Parameters:
+        repo: The path to Git repository.
+
+    Returns:
+        The latest tag.
+    """
+    repo = _resolve_repo(repo)
+    return _get_latest_tag(repo, _tags_mtime(repo))
+
+
+@lru_cache(maxsize=32)
+def _get_repo_root(repo: Path) -> str:
+    process = _run_git("rev-parse", "--show-toplevel", cwd=repo, stdout=subprocess.PIPE, check=True)
+    return process.stdout.decode().strip()
+
+
 def get_repo_root(repo: str | Path) -> str:
     """Get the root of a Git repository.
 
+    Results are cached for each path.
+
     Parameters:
         repo: The path to a Git repository.
 
     Returns:
         The root of the repository.
     """
-    if isinstance(repo, str):
-        repo = Path(repo)
-    if not repo.is_dir():
-        repo = repo.parent
-    output = subprocess.check_output(
-        ["git", "rev-parse", "--show-toplevel"],
-        cwd=repo,
+    return _get_repo_root(_resolve_repo(repo))
+
+
+def _loadable_pathspecs(search_paths: Sequence[str | Path] | None) -> list[str]:
+    # Git pathspecs matching the files that can be loaded from the given search paths
+    # (relative to the repository root), skipping hidden directories such as virtual environments.
+    pathspecs = [":(top,exclude,glob)**/.*/**"]
+    for search_path in search_paths or ["."]:
+        prefix = Path(search_path).as_posix().rstrip("/")
+        prefix = "" if prefix == "." else f"{prefix}/"
+        pathspecs.extend(f":(top,glob){prefix}**/*{suffix}" for suffix in _LOADABLE_SUFFIXES)
+    return pathspecs
+
+
+def _is_clean_head(repo: str | Path, ref: str, search_paths: Sequence[str | Path] | None = None) -> bool:
+    # Whether the reference points to the currently checked out commit,
+    # and the loadable files of the working tree have no changes (untracked and ignored files included),
+    # meaning the loader would find exactly the same files as in a worktree.
+    process = _run_git(
+        "-C",
+        repo,
+        "rev-parse",
+        "HEAD",
+        f"{ref}^{{commit}}",
+        capture_output=True,
+        text=True,
+        check=False,
     )
-    return output.decode().strip()
+    if process.returncode:
+        return False
+    head, commit = process.stdout.split()
+    if head != commit:
+        return False
+    process = _run_git(
+        "-C",
+        repo,
+        "status",
+        "--porcelain",
+        "--ignored",
+        "--",
+        *_loadable_pathspecs(search_paths),
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return process.returncode == 0 and not process.stdout.strip()
+
+
+def _worktree_cache_dir(repo: str | Path) -> Path | None:
+    # Worktrees are only cached (and reused across calls) when users opt in
+    # by setting the `GRIFFE_WORKTREE_CACHE` environment variable to a directory.
+    # Each repository gets its own sub-directory, keyed by a hash of its absolute path.
+    cache_root = os.environ.get("GRIFFE_WORKTREE_CACHE")
+    if not cache_root:
+        return None
+    repo_path = Path(repo).resolve()
+    repo_hash = hashlib.sha256(str(repo_path).encode()).hexdigest()[:12]
+    return Path(cache_root) / f"{_WORKTREE_PREFIX}{repo_path.name}-{repo_hash}"
+
+
+def _evict_cached_worktrees(repo: str | Path, cache_dir: Path) -> None:
+    # Keep only the most recently used worktrees of this repository.
+    worktrees = sorted(
+        (path for path in cache_dir.iterdir() if path.is_dir()),
+        key=lambda path: path.stat().st_mtime,
+        reverse=True,
+    )
+    for worktree in worktrees[_WORKTREE_CACHE_SIZE:]:
+        with _lock_worktree(worktree) as locked:
+            # Worktrees in use by other threads or processes are kept.
+            if not locked:
+                continue
+            _run_git(
+                "-C",
+                repo,
+                "worktree",
+                "remove",
+                "--force",
+                worktree,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                check=False,
+            )
+            shutil.rmtree(worktree, ignore_errors=True)
+    _run_git("-C", repo, "worktree", "prune", stdout=subprocess.DEVNULL, check=False)
+
+
+def _update_cached_worktree(location: Path, commit: str) -> bool:
+    # Check out the given commit in an existing cached worktree, and remove untracked files.
+    # Only linked worktrees have a `.git` file: we never reset a directory
+    # that is not a worktree, as Git would then operate on a parent repository.
+    if not (location / ".git").is_file():
+        return False
+    process = _run_git(
+        "-C",
+        location,
+        "reset",
+        "--hard",
+        "--quiet",
+        commit,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        check=False,
+    )
+    if process.returncode:
+        return False
+    # Double force is required to remove nested repositories, such as submodules absent from the commit.
+    _run_git("-C", location, "clean", "-ffdxq", stdout=subprocess.DEVNULL, check=False)
+    return True
+
+
+@contextmanager
+def _lock_worktree(location: Path) -> Iterator[bool]:
+    # Cached worktrees can be used by several threads or processes sharing the same cache directory.
+    # Each one is locked while in use (a lock file next to it), and the context value tells
+    # whether the lock could be acquired. Locks are released by the operating system
+    # when the lock file is closed, even if the process crashed.
+    location.parent.mkdir(parents=True, exist_ok=True)
+    with location.with_name(f"{location.name}.lock").open("a") as lock_file:
+        fd = lock_file.fileno()
+        try:
+            if sys.platform == "win32":
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            if sys.platform == "win32":
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+def _cached_worktree(repo: str | Path, ref: str, cache_dir: Path, *, init_submodules: bool = False) -> Path:
+    # `HEAD` is specific to each worktree, so we resolve the reference
+    # in the main repository before checking it out in the cached worktree.
+    process = _run_git(
+        "-C",
+        repo,
+        "rev-parse",
+        "--verify",
+        "--quiet",
+        f"{ref}^{{commit}}",
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if process.returncode:
+        raise RuntimeError(f"Could not create git worktree: invalid reference {ref!r}")
+    commit = process.stdout.strip()
+
+    location = cache_dir / _normalize(ref)
+    if _update_cached_worktree(location, commit):
+        os.utime(location)
+    else:
+        # The location is missing, or is not a valid worktree anymore: we recreate it.
+        # Worktrees whose directory was deleted (for example when users clear the cache)
+        # are still registered in the repository, so we prune them first.
+        shutil.rmtree(location, ignore_errors=True)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _run_git("-C", repo, "worktree", "prune", stdout=subprocess.DEVNULL, check=False)
+        process = _run_git(
+            "-C",
+            repo,
+            "worktree",
+            "add",
+            "--detach",
+            location,
+            commit,
+            capture_output=True,
+            check=False,
+        )
+        if process.returncode:
+            raise RuntimeError(f"Could not create git worktree: {process.stderr.decode()}")
+        _evict_cached_worktrees(repo, cache_dir)
+    if init_submodules:
+        _init_submodules(repo, location)
+    return location
+
+
+def _checkout_size(repo: str | Path, ref: str) -> int | None:
+    # Sum of the sizes of all files at the given reference.
+    process = _run_git("-C", repo, "ls-tree", "-r", "-l", ref, capture_output=True, text=True, check=False)
+    if process.returncode:
+        return None
+    return sum(int(size) for line in process.stdout.splitlines() if (size := line.split(maxsplit=4)[3]) != "-")
+
+
+def _worktree_tmp_dir(repo: str | Path, ref: str) -> str | None:
+    # Users can choose where temporary worktrees are created with the `GRIFFE_TMPDIR` environment variable.
+    # Otherwise, we use the RAM-backed `/dev/shm` directory when it is available and has enough free space
+    # for the checkout, to avoid disk writes. `None` means the default temporary directory.
+    if tmp_dir := os.environ.get("GRIFFE_TMPDIR"):
+        return tmp_dir
+    shm = Path("/dev/shm")  # noqa: S108
+    if not shm.is_dir() or not os.access(shm, os.W_OK):
+        return None
+    size = _checkout_size(repo, ref)
+    if size is None or shutil.disk_usage(shm).free <= size:
+        return None
+    return str(shm)
+
+
+def _submodules(location: str | Path) -> dict[str, str]:
+    # Map of submodules paths to their names, as declared in the worktree's `.gitmodules` file.
+    process = _run_git(
+        "config",
+        "--file",
+        Path(location, ".gitmodules"),
+        "--null",
+        "--get-regexp",
+        r"^submodule\..*\.path$",
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    submodules = {}
+    for entry in process.stdout.split("\0"):
+        if entry:
+            key, path = entry.split("\n", 1)
+            submodules[path] = key[len("submodule.") : -len(".path")]
+    return submodules
+
+
+def _init_submodules(repo: str | Path, location: str | Path) -> None:
+    # Initialize the Git submodules of the worktree, borrowing objects from the submodules
+    # already cloned in the main repository (if any) instead of cloning them again.
+    submodules = _submodules(location)
+    if not submodules:
+        return
+    process = _run_git("-C", location, "submodule", "status", capture_output=True, text=True, check=False)
+    modules_dir = (_find_common_git_dir(Path(repo).resolve()) or Path(repo, ".git")) / "modules"
+    for line in process.stdout.splitlines():
+        # Uninitialized submodules are prefixed with `-`, out-of-date ones with `+`.
+        if line[:1] not in {"-", "+"}:
+            continue
+        # Lines are formatted as `<status><sha> <path>`, optionally followed by ` (<description>)`.
+        status_path = line[1:].split(" ", 1)[1]
+        path = next(
+            (path for path in submodules if status_path == path or status_path.startswith(f"{path} (")),
+            None,
+        )
+        if path is None:
+            continue
+        # Submodules are cloned in the modules directory under their name, not their path.
+        reference = modules_dir / submodules[path]
+        options = ("--reference", reference) if reference.is_dir() else ()
+        try:
+            process = _run_git(
+                "-C",
+                location,
+                "submodule",
+                "update",
+                "--init",
+                *options,
+                "--",
+                path,
+                capture_output=True,
+                check=False,
+                timeout=30,
+            )
+        except subprocess.TimeoutExpired as error:
+            raise RuntimeError(f"Could not initialize git submodule {path}: timed out") from error
+        if process.returncode:
+            raise RuntimeError(f"Could not initialize git submodule {path}: {process.stderr.decode()}")
+
+
+def _remove_worktree(repo: str | Path, location: str | Path) -> None:
+    _run_git("-C", repo, "worktree", "remove", "--force", location, stdout=subprocess.DEVNULL, check=False)
+    _run_git("-C", repo, "worktree", "prune", stdout=subprocess.DEVNULL, check=False)
 
 
 @contextmanager
-def tmp_worktree(repo: str | Path = ".", ref: str = "HEAD") -> Iterator[Path]:
+def tmp_worktree(
+    repo: str | Path = ".",
+    ref: str = "HEAD",
+    *,
+    init_submodules: bool = False,
+    force_worktree: bool = False,
+) -> Iterator[Path]:
     """Context manager that checks out the given reference in the given repository to a temporary worktree.
 
+    If the reference points to the currently checked out commit and the working tree is clean,
+    no worktree is created and the root of the repository itself is yielded
+    (unless `force_worktree` or `init_submodules` is true). Only changes to Python files
+    (sources, stubs, compiled modules and `.pth` files) outside hidden directories are considered.
+
+    Temporary worktrees are created in the directory specified by the `GRIFFE_TMPDIR`
+    environment variable, or in `/dev/shm` when it is available and has enough free space,
+    or in the default temporary directory.
+
+    If the `GRIFFE_WORKTREE_CACHE` environment variable is set to a directory,
+    worktrees are created in this directory and kept after use, so that subsequent
+    calls with the same repository and reference can reuse them instead of creating
+    new ones. Only the most recently used worktrees of each repository are kept.
+    Cached worktrees are locked while in use: if another thread or process is already
+    using the cached worktree of a reference, a temporary worktree is created instead.
+
     Parameters:
         repo: Path to the repository (i.e. the directory *containing* the `.git` directory)
         ref: A Git reference such as a commit, tag or branch.
+        init_submodules: Whether to initialize the Git submodules of the worktree.
+            Objects of submodules already cloned in the repository are reused.
+        force_worktree: Whether to always create a worktree, even when the reference
+            points to the currently checked out commit and the working tree is clean.
 
     Yields:
         The path to the temporary worktree.
@@ -113,13 +480,49 @@ def tmp_worktree(repo: str | Path = ".", ref: str = "HEAD") -> Iterator[Path]:
         OSError: If `repo` is not a valid `.git` repository
         RuntimeError: If the `git` executable is unavailable, or if it cannot create a worktree
     """
+    with _tmp_worktree(repo, ref, init_submodules=init_submodules, force_worktree=force_worktree) as worktree:
+        yield worktree
+
+
+@contextmanager
+def _tmp_worktree(
+    repo: str | Path,
+    ref: str,
+    *,
+    init_submodules: bool,
+    force_worktree: bool,
+    use_cache: bool = True,
+    search_paths: Sequence[str | Path] | None = None,
+) -> Iterator[Path]:
     assert_git_repo(repo)
+    if not shutil.which("git"):
+        raise RuntimeError("Could not find git executable. Please install git.")
+    if not force_worktree and not init_submodules and _is_clean_head(repo, ref, search_paths):
+        yield Path(get_repo_root(repo))
+        return
+    # Cached worktrees are shared by reference, so callers checking out
+    # several references concurrently must opt out of the cache.
+    cache_dir = _worktree_cache_dir(repo) if use_cache else None
+    if cache_dir is not None:
+        # When the cached worktree is already in use, we fall back to a temporary worktree.
+        with _lock_worktree(cache_dir / _normalize(ref)) as locked:
+            if locked:
+                yield _cached_worktree(repo, ref, cache_dir, init_submodules=init_submodules)
+                return
+
     repo_name = Path(repo).resolve().name
     normref = _normalize(ref)
-    with TemporaryDirectory(prefix=f"{_WORKTREE_PREFIX}{repo_name}-{normref}-") as tmp_dir:
+    tmp_root = _worktree_tmp_dir(repo, ref)
+    with TemporaryDirectory(prefix=f"{_WORKTREE_PREFIX}{repo_name}-{normref}-", dir=tmp_root) as tmp_dir:
         location = os.path.join(tmp_dir, normref)  # noqa: PTH118
-        process = subprocess.run(
-            ["git", "-C", repo, "worktree", "add", "-b", normref, location, ref],
+        process = _run_git(
+            "-C",
+            repo,
+            "worktree",
+            "add",
+            "--detach",
+            location,
+            ref,
             capture_output=True,
             check=False,
         )
@@ -127,8 +530,8 @@ def tmp_worktree(repo: str | Path = ".", ref: str = "HEAD") -> Iterator[Path]:
             raise RuntimeError(f"Could not create git worktree: {process.stderr.decode()}")
 
         try:
+            if init_submodules:
+                _init_submodules(repo, location)
             yield Path(location)
         finally:
-            subprocess.run(["git", "-C", repo, "worktree", "remove", normref], stdout=subprocess.DEVNULL, check=False)
-            subprocess.run(["git", "-C", repo, "worktree", "prune"], stdout=subprocess.DEVNULL, check=False)
-            subprocess.run(["git", "-C", repo, "branch", "-D", normref], stdout=subprocess.DEVNULL, check=False)
+            _remove_worktree(repo, location)
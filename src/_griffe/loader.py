@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import sys
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, ClassVar, cast
 
@@ -21,7 +24,7 @@ from _griffe.exceptions import (
 from _griffe.expressions import ExprName
 from _griffe.extensions.base import Extensions, load_extensions
 from _griffe.finder import ModuleFinder, NamespacePackage, Package
-from _griffe.git import tmp_worktree
+from _griffe.git import _tmp_worktree
 from _griffe.importer import dynamic_import
 from _griffe.logger import logger
 from _griffe.merger import merge_stubs
@@ -29,7 +32,9 @@ from _griffe.models import Alias, Module, Object
 from _griffe.stats import Stats
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
+    from concurrent.futures import Future
+    from contextlib import AbstractContextManager
 
     from _griffe.enumerations import Parser
 
@@ -826,6 +831,8 @@ def load_git(
     ref: str = "HEAD",
     repo: str | Path = ".",
     submodules: bool = True,
+    init_submodules: bool = False,
+    force_worktree: bool = False,
     extensions: Extensions | None = None,
     search_paths: Sequence[str | Path] | None = None,
     docstring_parser: Parser | None = None,
@@ -844,6 +851,8 @@ def load_git(
     This function will create a temporary
     [git worktree](https://git-scm.com/docs/git-worktree) at the requested reference
     before loading `module` with [`griffe.load`][griffe.load].
+    If the reference points to the currently checked out commit and the Python files
+    of the search paths have no changes, the module is loaded from the repository directly.
 
     This function requires that the `git` executable is installed.
 
@@ -860,6 +869,9 @@ def load_git(
         repo: Path to the repository (i.e. the directory *containing* the `.git` directory)
         submodules: Whether to recurse on the submodules.
             This parameter only makes sense when loading a package (top-level module).
+        init_submodules: Whether to initialize the Git submodules of the repository in the worktree.
+        force_worktree: Whether to always create a worktree, even when the reference
+            points to the currently checked out commit and the working tree is clean.
         extensions: The extensions to use.
         search_paths: The paths to search into (relative to the repository root).
         docstring_parser: The docstring parser to use. By default, no parsing is done.
@@ -880,17 +892,19 @@ def load_git(
     Returns:
         A Griffe object.
     """
-    with tmp_worktree(repo, ref) as worktree:
-        search_paths = [worktree / path for path in search_paths or ["."]]
-        if isinstance(objspec, Path):
-            objspec = worktree / objspec
-
-        return load(
+    with _tmp_worktree(
+        repo,
+        ref,
+        init_submodules=init_submodules,
+        force_worktree=force_worktree,
+        search_paths=_loadable_paths(objspec, search_paths),
+    ) as worktree:
+        return _load_worktree(
+            worktree,
             objspec,
+            search_paths,
             submodules=submodules,
-            try_relative_path=False,
             extensions=extensions,
-            search_paths=search_paths,
             docstring_parser=docstring_parser,
             docstring_options=docstring_options,
             lines_collection=lines_collection,
@@ -904,6 +918,157 @@ def load_git(
         )
 
 
+def load_git_many(
+    objspec: str | Path | None = None,
+    /,
+    *,
+    refs: Iterable[str],
+    repo: str | Path = ".",
+    max_workers: int = 4,
+    submodules: bool = True,
+    init_submodules: bool = False,
+    force_worktree: bool = False,
+    extensions: Extensions | None = None,
+    search_paths: Sequence[str | Path] | None = None,
+    docstring_parser: Parser | None = None,
+    docstring_options: dict[str, Any] | None = None,
+    allow_inspection: bool = True,
+    force_inspection: bool = False,
+    find_stubs_package: bool = False,
+    resolve_aliases: bool = False,
+    resolve_external: bool | None = None,
+    resolve_implicit: bool = False,
+) -> Iterator[tuple[str, Object | Alias]]:
+    """Load and yield a module from several Git references.
+
+    This function works like [`load_git`][griffe.load_git], but prepares
+    the worktrees of the next references in background threads
+    while the module is loaded from the current one.
+    Modules are loaded one after the other, in the calling thread,
+    each with its own lines and modules collections.
+    A reference given several times is loaded only once,
+    and the same object is yielded for each of its occurrences
+    (it is kept in memory until its last occurrence is yielded).
+    Worktrees are never taken from the `GRIFFE_WORKTREE_CACHE` directory,
+    since concurrent checkouts cannot share them.
+
+    Examples:
+        ```python
+        from griffe import load_git_many
+
+        for ref, api in load_git_many(
+            "my_module", refs=["v0.1.0", "v0.2.0"], repo="path/to/repo"
+        ):
+            ...
+        ```
+
+    Parameters:
+        objspec: The Python path of an object, or file path to a module.
+        refs: Git references such as commits, tags or branches.
+        repo: Path to the repository (i.e. the directory *containing* the `.git` directory)
+        max_workers: The maximum number of worktrees prepared in advance, in parallel.
+        submodules: Whether to recurse on the submodules.
+            This parameter only makes sense when loading a package (top-level module).
+        init_submodules: Whether to initialize the Git submodules of the repository in the worktrees.
+        force_worktree: Whether to always create worktrees, even for references
+            pointing to the currently checked out commit when the working tree is clean.
+        extensions: The extensions to use.
+        search_paths: The paths to search into (relative to the repository root).
+        docstring_parser: The docstring parser to use. By default, no parsing is done.
+        docstring_options: Additional docstring parsing options.
+        allow_inspection: Whether to allow inspecting modules when visiting them is not possible.
+        force_inspection: Whether to force using dynamic analysis when loading data.
+        find_stubs_package: Whether to search for stubs-only package.
+            If both the package and its stubs are found, they'll be merged together.
+            If only the stubs are found, they'll be used as the package itself.
+        resolve_aliases: Whether to resolve aliases.
+        resolve_external: Whether to try to load unspecified modules to resolve aliases.
+            Default value (`None`) means to load external modules only if they are the private sibling
+            or the origin module (for example when `ast` imports from `_ast`).
+        resolve_implicit: When false, only try to resolve an alias if it is explicitly exported.
+
+    Yields:
+        Tuples of Git references and Griffe objects, in the same order as `refs`.
+    """
+    refs = list(refs)
+    # Each reference is checked out and loaded only once, even if it appears several times.
+    # Loaded objects are only kept until the last occurrence of their reference is yielded.
+    remaining = Counter(refs)
+    to_checkout = iter(dict.fromkeys(refs))
+    loaded: dict[str, Object | Alias] = {}
+
+    def checkout(ref: str) -> tuple[AbstractContextManager[Path], Path]:
+        # Worktrees are prepared concurrently, so each one gets its own location
+        # instead of a (possibly shared) cached one.
+        worktree_context = _tmp_worktree(
+            repo,
+            ref,
+            init_submodules=init_submodules,
+            force_worktree=force_worktree,
+            use_cache=False,
+            search_paths=_loadable_paths(objspec, search_paths),
+        )
+        return worktree_context, worktree_context.__enter__()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque[Future[tuple[AbstractContextManager[Path], Path]]] = deque(
+            executor.submit(checkout, ref) for ref in islice(to_checkout, max_workers)
+        )
+        try:
+            for ref in refs:
+                if ref not in loaded:
+                    worktree_context, worktree = pending.popleft().result()
+                    if (next_ref := next(to_checkout, None)) is not None:
+                        pending.append(executor.submit(checkout, next_ref))
+                    try:
+                        loaded[ref] = _load_worktree(
+                            worktree,
+                            objspec,
+                            search_paths,
+                            submodules=submodules,
+                            extensions=extensions,
+                            docstring_parser=docstring_parser,
+                            docstring_options=docstring_options,
+                            allow_inspection=allow_inspection,
+                            force_inspection=force_inspection,
+                            find_stubs_package=find_stubs_package,
+                            resolve_aliases=resolve_aliases,
+                            resolve_external=resolve_external,
+                            resolve_implicit=resolve_implicit,
+                        )
+                    finally:
+                        worktree_context.__exit__(None, None, None)
+                remaining[ref] -= 1
+                yield ref, loaded[ref] if remaining[ref] else loaded.pop(ref)
+        finally:
+            # Clean up worktrees prepared in advance but not used (errors, or iteration stopped early).
+            for future in pending:
+                with suppress(Exception):
+                    worktree_context, _ = future.result()
+                    worktree_context.__exit__(None, None, None)
+
+
+def _loadable_paths(objspec: str | Path | None, search_paths: Sequence[str | Path] | None) -> list[str | Path]:
+    # Paths (relative to the repository root) from which files can be loaded:
+    # the search paths, and the parent directory of the module when given as a file path.
+    paths = list(search_paths or ["."])
+    if isinstance(objspec, Path):
+        paths.append(objspec.parent)
+    return paths
+
+
+def _load_worktree(
+    worktree: Path,
+    objspec: str | Path | None,
+    search_paths: Sequence[str | Path] | None,
+    **kwargs: Any,
+) -> Object | Alias:
+    search_paths = [worktree / path for path in search_paths or ["."]]
+    if isinstance(objspec, Path):
+        objspec = worktree / objspec
+    return load(objspec, try_relative_path=False, search_paths=search_paths, **kwargs)
+
+
 def load_pypi(
     package: str,  # noqa: ARG001
     distribution: str,  # noqa: ARG001
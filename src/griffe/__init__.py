@@ -34,6 +34,7 @@ To load API data, Griffe provides several high-level functions.
 
 - [`griffe.load`][]: Load and return a Griffe object.
 - [`griffe.load_git`][]: Load and return a module from a specific Git reference.
+- [`griffe.load_git_many`][]: Load and yield a module from several Git references.
 - [`griffe.load_pypi`][]: Load and return a module from a specific package version downloaded using pip.
 
 ## Models
@@ -326,7 +327,7 @@ from _griffe.extensions.dataclasses import DataclassesExtension
 from _griffe.finder import ModuleFinder, NamePartsAndPathType, NamePartsType, NamespacePackage, Package
 from _griffe.git import assert_git_repo, get_latest_tag, get_repo_root, tmp_worktree
 from _griffe.importer import dynamic_import, sys_path
-from _griffe.loader import GriffeLoader, load, load_git, load_pypi
+from _griffe.loader import GriffeLoader, load, load_git, load_git_many, load_pypi
 from _griffe.logger import Logger, get_logger, logger, patch_loggers
 from _griffe.merger import merge_stubs
 from _griffe.mixins import (
@@ -543,6 +544,7 @@ __all__ = [
     "load",
     "load_extensions",
     "load_git",
+    "load_git_many",
     "load_pypi",
     "logger",
     "main",
@@ -75,6 +75,21 @@ def test_resolving_full_names() -> None:
         assert module["attribute2"].annotation.canonical_path == "package.module.Class"
 
 
+def test_resolving_long_attribute_chains() -> None:
+    """Assert paths of long attribute chains are correctly computed."""
+    with temporary_visited_module(
+        """
+        from package import module as mod
+        attribute: mod.sub.subsub.Class
+        unresolved: unknown.sub.Class
+        """,
+    ) as module:
+        annotation = module["attribute"].annotation
+        assert annotation.path == "mod.sub.subsub.Class"
+        assert annotation.canonical_path == "package.module.sub.subsub.Class"
+        assert module["unresolved"].annotation.canonical_path == "unknown.sub.Class"
+
+
 @pytest.mark.parametrize("code", syntax_examples)
 def test_expressions(code: str) -> None:
     """Test building annotations from AST nodes.
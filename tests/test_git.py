@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import gc
+import os
 import shutil
+import weakref
 from subprocess import run
 from typing import TYPE_CHECKING
 
 import pytest
 
-from griffe import Module, check, load_git
+from _griffe.git import _is_clean_head
+from griffe import Module, assert_git_repo, check, get_latest_tag, load_git, load_git_many, tmp_worktree
 from tests import FIXTURES_DIR
 
 if TYPE_CHECKING:
@@ -69,6 +73,38 @@ def git_repo(tmp_path: Path) -> Path:
     return repo_path
 
 
+@pytest.fixture
+def sub_repo(git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Fixture that creates a git repo and adds it as a submodule of `git_repo`.
+
+    The submodule contains the `v0.1.0` version of the module, tagged `v1`.
+    It is added under the `sub` path (named `sub-name`), and committed in `git_repo`.
+
+    Parameters:
+        git_repo: temporary git repo
+        tmp_path: temporary directory fixture
+        monkeypatch: Pytest fixture to patch the environment.
+
+    Returns:
+        Path: path to the temporary submodule repo.
+    """
+    # Allow cloning submodules from local paths.
+    monkeypatch.setenv("GIT_CONFIG_COUNT", "1")
+    monkeypatch.setenv("GIT_CONFIG_KEY_0", "protocol.file.allow")
+    monkeypatch.setenv("GIT_CONFIG_VALUE_0", "always")
+    repo_path = tmp_path / "sub-repo"
+    _copy_contents(REPO_SOURCE / "v0.1.0", repo_path)
+    run(["git", "-C", str(repo_path), "init"], check=True)
+    run(["git", "-C", str(repo_path), "config", "user.name", "Name"], check=True)
+    run(["git", "-C", str(repo_path), "config", "user.email", "my@email.com"], check=True)
+    run(["git", "-C", str(repo_path), "add", "."], check=True)
+    run(["git", "-C", str(repo_path), "commit", "-m", "v0.1.0"], check=True)
+    run(["git", "-C", str(repo_path), "tag", "v1"], check=True)
+    run(["git", "-C", str(git_repo), "submodule", "add", "--name", "sub-name", str(repo_path), "sub"], check=True)
+    run(["git", "-C", str(git_repo), "commit", "-m", "add submodule"], check=True)
+    return repo_path
+
+
 def test_load_git(git_repo: Path) -> None:
     """Test that we can load modules from different commits from a git repo.
 
@@ -83,6 +119,68 @@ def test_load_git(git_repo: Path) -> None:
     assert v2.attributes["__version__"].value == "'0.2.0'"
 
 
+def test_load_git_many(git_repo: Path) -> None:
+    """Test that we can load modules from several commits of a git repo.
+
+    Parameters:
+        git_repo: temporary git repo
+    """
+    refs = ["v0.1.0", "v0.2.0", "v0.1.0"]
+    results = list(load_git_many(MODULE_NAME, refs=refs, repo=git_repo, max_workers=2))
+    assert [ref for ref, _ in results] == refs
+    assert [module.attributes["__version__"].value for _, module in results] == ["'0.1.0'", "'0.2.0'", "'0.1.0'"]
+    worktrees = run(["git", "-C", str(git_repo), "worktree", "list"], check=True, capture_output=True, text=True)
+    assert len(worktrees.stdout.splitlines()) == 1
+
+
+def test_load_git_many_releases_modules(git_repo: Path) -> None:
+    """Test that modules are not kept in memory after the last occurrence of their reference.
+
+    Parameters:
+        git_repo: temporary git repo
+    """
+    results = load_git_many(MODULE_NAME, refs=["v0.1.0", "v0.2.0", "v0.1.0"], repo=git_repo, max_workers=1)
+    _, v1 = next(results)
+    _, v2 = next(results)
+    v2_ref = weakref.ref(v2)
+    del v2
+    gc.collect()
+    assert v2_ref() is None
+    _, v1_again = next(results)
+    assert v1_again is v1
+
+
+def test_load_git_many_with_worktree_cache(
+    git_repo: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that concurrent checkouts do not share cached worktrees.
+
+    Parameters:
+        git_repo: temporary git repo
+        tmp_path: temporary directory fixture
+        monkeypatch: pytest fixture to patch the environment
+    """
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("GRIFFE_WORKTREE_CACHE", str(cache_dir))
+    run(["git", "-C", str(git_repo), "branch", "feat/x", "v0.1.0"], check=True)
+    run(["git", "-C", str(git_repo), "branch", "feat-x", "v0.2.0"], check=True)
+    refs = ["v0.1.0", "v0.1.0", "v0.1.0", "feat/x", "feat-x"]
+    results = list(load_git_many(MODULE_NAME, refs=refs, repo=git_repo, max_workers=3, force_worktree=True))
+    assert [ref for ref, _ in results] == refs
+    assert [module.attributes["__version__"].value for _, module in results] == [
+        "'0.1.0'",
+        "'0.1.0'",
+        "'0.1.0'",
+        "'0.1.0'",
+        "'0.2.0'",
+    ]
+    assert not cache_dir.exists() or not any(cache_dir.iterdir())
+    worktrees = run(["git", "-C", str(git_repo), "worktree", "list"], check=True, capture_output=True, text=True)
+    assert len(worktrees.stdout.splitlines()) == 1
+
+
 def test_load_git_errors(git_repo: Path) -> None:
     """Test that we get informative errors for various invalid inputs.
 
@@ -99,6 +197,266 @@ def test_load_git_errors(git_repo: Path) -> None:
         load_git("not_a_real_module", ref="v0.2.0", repo=git_repo)
 
 
+def test_assert_git_repo(git_repo: Path, tmp_path: Path) -> None:
+    """Test that Git repositories and their worktrees are detected.
+
+    Parameters:
+        git_repo: temporary git repo
+        tmp_path: temporary directory fixture
+    """
+    assert_git_repo(git_repo)
+    assert_git_repo(git_repo / "my_module")
+    with tmp_worktree(git_repo, "v0.1.0") as worktree:
+        assert_git_repo(worktree)
+    with pytest.raises(OSError, match="Not a git repository"):
+        assert_git_repo(tmp_path)
+
+
+def test_no_worktree_for_clean_head(git_repo: Path) -> None:
+    """Test that the repository is used directly when loading its clean, checked out commit.
+
+    Parameters:
+        git_repo: temporary git repo
+    """
+    for ref in ("HEAD", "v0.2.0"):
+        with tmp_worktree(git_repo, ref) as worktree:
+            assert worktree == git_repo.resolve()
+    with tmp_worktree(git_repo, "HEAD", force_worktree=True) as worktree:
+        assert worktree != git_repo.resolve()
+    (git_repo / "untracked.py").touch()
+    with tmp_worktree(git_repo, "v0.2.0") as worktree:
+        assert worktree != git_repo.resolve()
+
+
+def test_worktree_for_head_with_ignored_files(git_repo: Path) -> None:
+    """Test that ignored files of the checkout prevent using the repository directly.
+
+    Parameters:
+        git_repo: temporary git repo
+    """
+    (git_repo / ".git" / "info" / "exclude").write_text(f"{MODULE_NAME}/gen.py\n")
+    (git_repo / MODULE_NAME / "gen.py").touch()
+    with tmp_worktree(git_repo, "HEAD") as worktree:
+        assert worktree != git_repo.resolve()
+        assert not (worktree / MODULE_NAME / "gen.py").exists()
+
+
+def test_no_worktree_for_head_with_ignored_caches(git_repo: Path) -> None:
+    """Test that ignored files that cannot be loaded do not prevent using the repository directly.
+
+    Parameters:
+        git_repo: temporary git repo
+    """
+    (git_repo / ".gitignore").write_text("__pycache__/\n.venv/\n*.log\n")
+    run(["git", "-C", str(git_repo), "add", ".gitignore"], check=True)
+    run(["git", "-C", str(git_repo), "commit", "-m", "ignore caches"], check=True)
+    (git_repo / MODULE_NAME / "__pycache__").mkdir(exist_ok=True)
+    (git_repo / MODULE_NAME / "__pycache__" / "__init__.cpython-312.pyc").touch()
+    (git_repo / ".venv" / "lib").mkdir(parents=True)
+    (git_repo / ".venv" / "lib" / "site.py").touch()
+    (git_repo / "debug.log").touch()
+    with tmp_worktree(git_repo, "HEAD") as worktree:
+        assert worktree == git_repo.resolve()
+    assert load_git(MODULE_NAME, ref="HEAD", repo=git_repo).attributes["__version__"].value == "'0.2.0'"
+
+    # Ignored Python files outside of the search paths cannot be loaded either.
+    (git_repo / "scripts").mkdir()
+    (git_repo / "scripts" / "gen.py").touch()
+    (git_repo / ".git" / "info" / "exclude").write_text("scripts/\n")
+    with tmp_worktree(git_repo, "HEAD") as worktree:
+        assert worktree != git_repo.resolve()
+    assert _is_clean_head(git_repo, "HEAD", [MODULE_NAME])
+
+
+def test_worktree_tmp_dir(git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that temporary worktrees are created in the configured directory.
+
+    Parameters:
+        git_repo: temporary git repo
+        tmp_path: temporary directory fixture
+        monkeypatch: Pytest fixture to patch the environment.
+    """
+    tmp_dir = tmp_path / "tmp"
+    tmp_dir.mkdir()
+    monkeypatch.setenv("GRIFFE_TMPDIR", str(tmp_dir))
+    with tmp_worktree(git_repo, "v0.1.0") as worktree:
+        assert worktree.parent.parent == tmp_dir
+    assert not list(tmp_dir.iterdir())
+
+
+def test_worktree_submodules(git_repo: Path, sub_repo: Path) -> None:
+    """Test that Git submodules can be initialized in worktrees.
+
+    Parameters:
+        git_repo: temporary git repo
+        sub_repo: temporary git repo used as a submodule of `git_repo`
+    """
+    run(["git", "-C", str(git_repo), "tag", "with-submodule"], check=True)
+
+    with tmp_worktree(git_repo, "with-submodule", force_worktree=True) as worktree:
+        assert not (worktree / "sub" / MODULE_NAME).exists()
+    with tmp_worktree(git_repo, "with-submodule", init_submodules=True) as worktree:
+        init_module = (worktree / "sub" / MODULE_NAME / "__init__.py").read_text()
+        assert init_module == (sub_repo / MODULE_NAME / "__init__.py").read_text()
+        alternates = run(
+            ["git", "-C", str(worktree / "sub"), "rev-parse", "--git-path", "objects/info/alternates"],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        assert (worktree / "sub" / alternates).is_file()
+
+
+def test_cached_worktree_outdated_submodules(
+    git_repo: Path,
+    sub_repo: Path,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that out-of-date submodules are updated in reused worktrees.
+
+    Parameters:
+        git_repo: temporary git repo
+        sub_repo: temporary git repo used as a submodule of `git_repo`
+        tmp_path: temporary directory fixture
+        monkeypatch: Pytest fixture to patch the environment.
+    """
+    monkeypatch.setenv("GRIFFE_WORKTREE_CACHE", str(tmp_path / "cache"))
+    run(["git", "-C", str(git_repo), "branch", "feature"], check=True)
+
+    with tmp_worktree(git_repo, "feature", init_submodules=True) as worktree:
+        assert "0.1.0" in (worktree / "sub" / MODULE_NAME / "__init__.py").read_text()
+
+    _copy_contents(REPO_SOURCE / "v0.2.0", sub_repo)
+    run(["git", "-C", str(sub_repo), "add", "."], check=True)
+    run(["git", "-C", str(sub_repo), "commit", "-m", "v0.2.0"], check=True)
+    run(["git", "-C", str(git_repo / "sub"), "pull", "-q", "origin", "HEAD"], check=True)
+    run(["git", "-C", str(git_repo), "commit", "-am", "update submodule"], check=True)
+    run(["git", "-C", str(git_repo), "branch", "-f", "feature"], check=True)
+
+    with tmp_worktree(git_repo, "feature", init_submodules=True) as worktree:
+        assert "0.2.0" in (worktree / "sub" / MODULE_NAME / "__init__.py").read_text()
+
+
+def test_latest_tag_cache_invalidation(git_repo: Path) -> None:
+    """Test that the cached latest tag is updated when tags are created.
+
+    Parameters:
+        git_repo: temporary git repo
+    """
+    assert get_latest_tag(git_repo) in {"v0.1.0", "v0.2.0"}
+    run(
+        ["git", "-C", str(git_repo), "tag", "-a", "v1.0.0", "-m", "v1.0.0"],
+        check=True,
+        env={**os.environ, "GIT_COMMITTER_DATE": "2000000000 +0000"},
+    )
+    assert get_latest_tag(git_repo) == "v1.0.0"
+
+
+def test_latest_tag_cache_invalidation_nested_tags(git_repo: Path) -> None:
+    """Test that the cached latest tag is updated when nested tags are created.
+
+    Parameters:
+        git_repo: temporary git repo
+    """
+    env = {**os.environ, "GIT_COMMITTER_DATE": "2000000000 +0000"}
+    run(["git", "-C", str(git_repo), "tag", "-a", "rel/a1", "-m", "rel/a1"], check=True, env=env)
+    assert get_latest_tag(git_repo) == "rel/a1"
+    env["GIT_COMMITTER_DATE"] = "2000000100 +0000"
+    run(["git", "-C", str(git_repo), "tag", "-a", "rel/a2", "-m", "rel/a2"], check=True, env=env)
+    assert get_latest_tag(git_repo) == "rel/a2"
+
+
 def test_git_failures(tmp_path: Path) -> None:
     """Test failures to use Git."""
     assert check(tmp_path) == 2
+
+
+def test_load_git_cached_worktrees(git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that worktrees are reused when the worktree cache is enabled.
+
+    Parameters:
+        git_repo: temporary git repo
+        tmp_path: temporary directory fixture
+        monkeypatch: Pytest fixture to patch the environment.
+    """
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("GRIFFE_WORKTREE_CACHE", str(cache_dir))
+    for _ in range(2):
+        v1 = load_git(MODULE_NAME, ref="v0.1.0", repo=git_repo, force_worktree=True)
+        v2 = load_git(MODULE_NAME, ref="v0.2.0", repo=git_repo, force_worktree=True)
+        assert v1.attributes["__version__"].value == "'0.1.0'"
+        assert v2.attributes["__version__"].value == "'0.2.0'"
+    (repo_cache,) = cache_dir.iterdir()
+    assert sorted(path.name for path in repo_cache.iterdir() if path.is_dir()) == ["v0-1-0", "v0-2-0"]
+
+    with pytest.raises(RuntimeError, match="Could not create git worktree"):
+        load_git(MODULE_NAME, ref="invalid-tag", repo=git_repo)
+
+
+def test_load_git_cleared_worktree_cache(git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that cached worktrees are recreated after the cache is cleared or corrupted.
+
+    Parameters:
+        git_repo: temporary git repo
+        tmp_path: temporary directory fixture
+        monkeypatch: Pytest fixture to patch the environment.
+    """
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("GRIFFE_WORKTREE_CACHE", str(cache_dir))
+    load_git(MODULE_NAME, ref="v0.1.0", repo=git_repo, force_worktree=True)
+    shutil.rmtree(cache_dir)
+    v1 = load_git(MODULE_NAME, ref="v0.1.0", repo=git_repo, force_worktree=True)
+    assert v1.attributes["__version__"].value == "'0.1.0'"
+
+    (repo_cache,) = cache_dir.iterdir()
+    (repo_cache / "v0-1-0" / ".git").write_text("gitdir: /not/a/git/dir\n")
+    v1 = load_git(MODULE_NAME, ref="v0.1.0", repo=git_repo, force_worktree=True)
+    assert v1.attributes["__version__"].value == "'0.1.0'"
+
+
+def test_cached_worktree_removed_submodules(
+    git_repo: Path,
+    sub_repo: Path,  # noqa: ARG001
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that submodules absent from the checked out commit are removed from reused worktrees.
+
+    Parameters:
+        git_repo: temporary git repo
+        sub_repo: temporary git repo used as a submodule of `git_repo`
+        tmp_path: temporary directory fixture
+        monkeypatch: Pytest fixture to patch the environment.
+    """
+    monkeypatch.setenv("GRIFFE_WORKTREE_CACHE", str(tmp_path / "cache"))
+    run(["git", "-C", str(git_repo), "branch", "feature"], check=True)
+    with tmp_worktree(git_repo, "feature", init_submodules=True) as worktree:
+        assert (worktree / "sub" / MODULE_NAME).is_dir()
+
+    run(["git", "-C", str(git_repo), "branch", "-f", "feature", "v0.1.0"], check=True)
+    with tmp_worktree(git_repo, "feature", force_worktree=True) as worktree:
+        assert not (worktree / "sub").exists()
+
+
+def test_cached_worktree_in_use(git_repo: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that cached worktrees in use are not reused concurrently.
+
+    Parameters:
+        git_repo: temporary git repo
+        tmp_path: temporary directory fixture
+        monkeypatch: Pytest fixture to patch the environment.
+    """
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setenv("GRIFFE_WORKTREE_CACHE", str(cache_dir))
+    run(["git", "-C", str(git_repo), "branch", "feat/x", "v0.1.0"], check=True)
+    run(["git", "-C", str(git_repo), "branch", "feat-x", "v0.2.0"], check=True)
+    with tmp_worktree(git_repo, "feat/x", force_worktree=True) as cached_worktree:
+        assert cached_worktree.is_relative_to(cache_dir)
+        with tmp_worktree(git_repo, "feat-x", force_worktree=True) as worktree:
+            assert not worktree.is_relative_to(cache_dir)
+            assert "0.2.0" in (worktree / MODULE_NAME / "__init__.py").read_text()
+        assert "0.1.0" in (cached_worktree / MODULE_NAME / "__init__.py").read_text()
+    with tmp_worktree(git_repo, "feat-x", force_worktree=True) as worktree:
+        assert worktree == cached_worktree
+        assert "0.2.0" in (worktree / MODULE_NAME / "__init__.py").read_text()